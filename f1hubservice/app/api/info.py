@@ -3,6 +3,8 @@ FastAPI router module for data about drivers.
 
 Routes:
     GET /driver/{driver_id}: Retrieves information about a specific driver by ID.
+    GET /laps/{year}/{round_number}/{session}: Retrieves the laps of a session with
+        weather and track status columns.
 
 Dependencies:
     - FastAPI for API routing and HTTP exception handling
@@ -10,10 +12,12 @@ Dependencies:
     - Logger for operation tracking
     - Data processor service for mathematical operations
 """
+from typing import Optional
 from fastapi import APIRouter, HTTPException
-from app.models.schemas import SeasonSchedule
+from app.models.schemas import SeasonSchedule, SessionLaps
 from app.core.logger import logger
 from app.services.info_processor import get_season_schedule
+from app.services.lap_processor import get_session_laps
 
 router = APIRouter()
 
@@ -36,3 +40,31 @@ def get_schedule(year: int = 2025) -> SeasonSchedule:
     except Exception as exc:
         logger.exception("Failed to fetch season schedule")
         raise HTTPException(status_code=500, detail=str(exc))
+
+@router.get("/laps/{year}/{round_number}/{session}", response_model=SessionLaps)
+def get_laps(year: int, round_number: int, session: str, driver: Optional[str] = None,
+             green_only: bool = False, track_temp_bin: Optional[str] = None) -> SessionLaps:
+    """
+    Fetch the laps of a session aligned with weather and track status.
+
+    Args:
+        year (int): The season year.
+        round_number (int): The round number within the season.
+        session (str): The session identifier, e.g. "FP1", "Q" or "R".
+        driver (Optional[str]): Only return laps of this driver abbreviation.
+        green_only (bool): Only return laps driven entirely under green flag.
+        track_temp_bin (Optional[str]): Only return laps in this track temperature bin,
+            e.g. "35-40".
+
+    Returns:
+        SessionLaps: The filtered laps of the session.
+    """
+    try:
+        logger.info("Fetching laps for %s round %s session %s", year, round_number, session)
+        laps = get_session_laps(year, round_number, session, driver=driver,
+                                green_only=green_only, track_temp_bin=track_temp_bin)
+        logger.info("Successfully fetched %d laps", len(laps.laps))
+        return laps
+    except Exception as exc:
+        logger.exception("Failed to fetch session laps")
+        raise HTTPException(status_code=500, detail=str(exc))
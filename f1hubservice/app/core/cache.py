@@ -0,0 +1,264 @@
+"""
+Cross-process cache for the F1 Analytics Hub service.
+
+This module provides a small cache backed by a SQLite database in WAL mode so that
+every uvicorn worker on the same host shares one copy of expensive upstream data
+(season schedules, session frames) instead of each worker fetching and holding
+its own.
+
+The cache offers:
+- Atomic fills: an entry is written in a single transaction, so readers never see
+  a partially stored value.
+- Single-flight fetches: a lock row per key ensures that only one worker calls the
+  upstream source for a missing key while the others wait for the result.
+- Size-bounded eviction: once the stored bytes exceed the configured limit the least
+  recently used entries are evicted.
+
+Values are serialized with pickle. The database is a local file owned by the service
+and must not be shared with untrusted writers.
+
+Example:
+
+    schedule = shared_cache.get_or_set("schedule:2025", lambda: fetch(2025), ttl=3600)
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS locks (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SharedCache:
+    """
+    SQLite-backed key/value cache shared by all worker processes on a host.
+
+    A new connection is opened for each operation, which keeps the cache safe to use
+    from FastAPI's thread pool and across forked workers.
+
+    Attributes:
+        path (str): Location of the SQLite database file.
+        max_bytes (int): Upper bound on the total size of stored values.
+        lock_timeout (float): Seconds a worker waits for another worker's fetch, and
+            the lifetime of a fetch lock left behind by a crashed worker.
+        poll_interval (float): Seconds between checks while waiting on a fetch lock.
+        touch_interval (float): Minimum age in seconds of an entry's last access time
+            before a hit records a new one. Hits inside this window stay read-only so
+            that workers reading a hot key do not contend for SQLite's writer lock.
+    """
+
+    def __init__(self, path: str, max_bytes: int, lock_timeout: float = 60.0,
+                 poll_interval: float = 0.05, touch_interval: float = 1.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.touch_interval = touch_interval
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode, creating the schema on first use."""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                    finally:
+                        conn.close()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a key.
+
+        Args:
+            key (str): The cache key.
+        Returns:
+            Tuple[bool, Any]: ``(True, value)`` on a hit, ``(False, None)`` on a miss
+            or when the entry has expired.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT value, accessed_at FROM entries "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return False, None
+            stale_before = now - self.touch_interval
+            if row[1] <= stale_before:
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ? AND accessed_at <= ?",
+                             (now, key, stale_before))
+        finally:
+            conn.close()
+        return True, pickle.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value and evict least recently used entries beyond ``max_bytes``.
+
+        Args:
+            key (str): The cache key.
+            value (Any): A picklable value.
+            ttl (Optional[float]): Seconds until the entry expires. ``None`` keeps it
+                until it is evicted.
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            logger.warning("Not caching %s: %d bytes exceeds cache limit of %d",
+                           key, len(blob), self.max_bytes)
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, len(blob), expires_at, now),
+                )
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used ones until under the limit."""
+        conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        logger.info("Evicted %d cache entries", len(victims))
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        """Remove every entry and any outstanding fetch locks."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM locks")
+        finally:
+            conn.close()
+
+    def _acquire(self, key: str, owner: str) -> bool:
+        """Try to take the fetch lock for a key, reclaiming it if its holder has expired."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM locks WHERE key = ? AND expires_at <= ?", (key, now))
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO locks (key, owner, expires_at) VALUES (?, ?, ?)",
+                    (key, owner, now + self.lock_timeout),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+        return cursor.rowcount == 1
+
+    def _release(self, key: str, owner: str) -> None:
+        """Release a fetch lock held by ``owner``."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM locks WHERE key = ? AND owner = ?", (key, owner))
+        finally:
+            conn.close()
+
+    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return the cached value for a key, computing it at most once across workers.
+
+        On a miss the caller races for the key's fetch lock. The winner calls ``factory``
+        and stores the result; the others poll until the value appears. If the holder
+        does not finish within ``lock_timeout`` the waiter computes the value itself.
+
+        Args:
+            key (str): The cache key.
+            factory (Callable[[], Any]): Produces the value on a miss.
+            ttl (Optional[float]): Seconds until the stored entry expires.
+        Returns:
+            Any: The cached or freshly computed value.
+        """
+        owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            hit, value = self.get(key)
+            if hit:
+                return value
+            if self._acquire(key, owner):
+                break
+            if time.monotonic() >= deadline:
+                logger.warning("Timed out waiting for cache fill of %s, fetching directly", key)
+                value = factory()
+                self.set(key, value, ttl)
+                return value
+            time.sleep(self.poll_interval)
+
+        try:
+            # Another worker may have filled the key between our miss and taking the lock
+            hit, value = self.get(key)
+            if hit:
+                return value
+            value = factory()
+            self.set(key, value, ttl)
+            return value
+        finally:
+            self._release(key, owner)
+
+
+shared_cache = SharedCache(
+    path=settings.cache_path,
+    max_bytes=settings.cache_max_bytes,
+    lock_timeout=settings.cache_lock_timeout,
+)
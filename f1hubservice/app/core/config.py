@@ -30,12 +30,28 @@ class Settings(BaseSettings):
         debug (bool): Whether to run the application in debug mode. Defaults to True.
         host (str): The host address to bind the server to. Defaults to "127.0.0.1".
         port (int): The port number to run the server on. Defaults to 8000.
+        cache_path (str): SQLite file backing the cache shared by all workers.
+            Defaults to ".cache/f1hub-cache.sqlite3".
+        cache_max_bytes (int): Maximum total size of cached values before least
+            recently used entries are evicted. Defaults to 512 MiB.
+        cache_lock_timeout (float): Seconds a worker waits for another worker to fill
+            a cache entry before fetching it itself. Defaults to 120.
+        schedule_cache_ttl (float): Seconds a cached season schedule stays fresh.
+            Defaults to 3600.
+        laps_cache_ttl (float): Seconds the aligned laps of a session stay cached, so
+            data cached while a session was still incomplete gets refreshed.
+            Defaults to 3600.
     """
     app_name: str = "F1 Analyzer Backend"
     debug: bool = True
     host: str = "127.0.0.1"
     port: int = 8000
     cors_allowed_origins: list[str] = ["*"]
+    cache_path: str = ".cache/f1hub-cache.sqlite3"
+    cache_max_bytes: int = 512 * 1024 * 1024
+    cache_lock_timeout: float = 120.0
+    schedule_cache_ttl: float = 3600.0
+    laps_cache_ttl: float = 3600.0
     class Config:
         """
         Configuration class for the F1 Analytics Hub service.
@@ -149,6 +149,89 @@ class SeasonSchedule(BaseModel):
     rounds: List[Union[RoundInfo, RoundSprintInfo, RoundSprintShootoutInfo]]
 
 
+class LapInfo(BaseModel):
+    """
+    Schema for a single lap aligned with the weather and track status of its session.
+    Session times and durations are expressed in seconds from the session start.
+    Attributes:
+        Driver (str): Three letter driver abbreviation
+        DriverNumber (str): The driver's car number
+        Team (Optional[str]): The team the driver raced for
+        LapNumber (Optional[float]): The lap number within the session
+        Stint (Optional[float]): The stint the lap belongs to
+        Compound (Optional[str]): The tyre compound used on the lap
+        TyreLife (Optional[float]): Laps driven on this set of tyres
+        LapTime (Optional[float]): The lap time in seconds
+        LapStartTime (Optional[float]): Session time at which the lap started
+        Time (Optional[float]): Session time at which the lap was set
+        PitInTime (Optional[float]): Session time at which the car entered the pit lane
+        PitOutTime (Optional[float]): Session time at which the car left the pit lane
+        IsPersonalBest (Optional[bool]): Whether the lap was the driver's best so far
+        Deleted (Optional[bool]): Whether the lap was deleted by the stewards, null when
+            race control messages are unavailable
+        AirTemp (Optional[float]): Air temperature in °C at lap start
+        TrackTemp (Optional[float]): Track temperature in °C at lap start
+        Humidity (Optional[float]): Relative humidity in % at lap start
+        Pressure (Optional[float]): Air pressure in mbar at lap start
+        Rainfall (Optional[bool]): Whether it was raining at lap start
+        WindSpeed (Optional[float]): Wind speed in m/s at lap start
+        WindDirection (Optional[float]): Wind direction in degrees at lap start
+        TrackTempBin (Optional[str]): Track temperature band, e.g. "35-40"
+        TrackStatusAtStart (Optional[str]): Track status code in effect at lap start
+        UnderYellowFlag (Optional[bool]): A yellow flag was shown during the lap
+        UnderSafetyCar (Optional[bool]): The safety car was deployed during the lap
+        UnderVirtualSafetyCar (Optional[bool]): The virtual safety car was active during the lap
+        UnderRedFlag (Optional[bool]): The session was red flagged during the lap
+        IsGreenLap (Optional[bool]): The lap was driven entirely under green flag conditions
+        The track status flags are null when track status data or the lap's timing
+        is unavailable.
+    """
+    Driver: str
+    DriverNumber: str
+    Team: Optional[str] = None
+    LapNumber: Optional[float] = None
+    Stint: Optional[float] = None
+    Compound: Optional[str] = None
+    TyreLife: Optional[float] = None
+    LapTime: Optional[float] = None
+    LapStartTime: Optional[float] = None
+    Time: Optional[float] = None
+    PitInTime: Optional[float] = None
+    PitOutTime: Optional[float] = None
+    IsPersonalBest: Optional[bool] = None
+    Deleted: Optional[bool] = None
+
+    AirTemp: Optional[float] = None
+    TrackTemp: Optional[float] = None
+    Humidity: Optional[float] = None
+    Pressure: Optional[float] = None
+    Rainfall: Optional[bool] = None
+    WindSpeed: Optional[float] = None
+    WindDirection: Optional[float] = None
+    TrackTempBin: Optional[str] = None
+
+    TrackStatusAtStart: Optional[str] = None
+    UnderYellowFlag: Optional[bool] = None
+    UnderSafetyCar: Optional[bool] = None
+    UnderVirtualSafetyCar: Optional[bool] = None
+    UnderRedFlag: Optional[bool] = None
+    IsGreenLap: Optional[bool] = None
+
+class SessionLaps(BaseModel):
+    """
+    Represents the laps of a single session of a Formula 1 event.
+    Attributes:
+        year (int): The year of the F1 season
+        round_number (int): The round number of the event within the season
+        session (str): The session identifier, e.g. "FP1", "Q" or "R"
+        laps (List[LapInfo]): The laps of the session with weather and track status
+    """
+    year: int
+    round_number: int
+    session: str
+    laps: List[LapInfo]
+
+
 class DataRequest(BaseModel):
     """
     Request schema for data operations.
@@ -3,16 +3,35 @@ F1 Season Schedule Information Processor
 
 This module provides functionality to fetch and process Formula 1 season schedules
 using the FastF1 library. It handles different event formats including conventional
-weekends and sprint qualifying formats.
+weekends and sprint qualifying formats. Schedules are kept in the shared cache so
+that every worker process reuses a single upstream fetch.
 
 Author: Rohith Ravindranath
 """
 import pandas as pd
 import fastf1
+from app.core.cache import shared_cache
+from app.core.config import settings
 from app.models.schemas import SeasonSchedule
 
 def get_season_schedule(year: int = 2025) -> SeasonSchedule:
     """Fetch the season schedule for a specific year.
+
+    The result is served from the cache shared across workers; only one worker
+    fetches a given year from upstream when it is missing or stale.
+    Args:
+        year (int): The year for which to fetch the season schedule.
+    Returns:
+        SeasonSchedule: The season schedule.
+    """
+    return shared_cache.get_or_set(
+        f"schedule:{year}",
+        lambda: _fetch_season_schedule(year),
+        ttl=settings.schedule_cache_ttl,
+    )
+
+def _fetch_season_schedule(year: int) -> SeasonSchedule:
+    """Fetch and parse the season schedule for a specific year from FastF1.
     Args:
         year (int): The year for which to fetch the season schedule.
     Returns:
@@ -0,0 +1,217 @@
+"""
+F1 Session Lap Processor
+
+This module loads lap data for a Formula 1 session using the FastF1 library and
+aligns every lap with the weather sample and track status in effect while it was
+driven. The alignment is done with vectorized as-of joins on session time, and the
+aligned laps are kept in the shared cache so each session is loaded and processed
+once across all workers.
+
+Derived columns added to each lap:
+- Weather at lap start: AirTemp, TrackTemp, Humidity, Pressure, Rainfall,
+  WindSpeed, WindDirection
+- TrackTempBin: the track temperature rounded down to a TRACK_TEMP_BIN_WIDTH band
+- TrackStatusAtStart: the track status code in effect when the lap started
+- UnderYellowFlag, UnderSafetyCar, UnderVirtualSafetyCar, UnderRedFlag: whether
+  that status was in effect at any point during the lap
+- IsGreenLap: the lap was driven entirely under green flag conditions
+
+The status flags are null when the session has no track status data or when a
+lap's start or end time is unknown, since neither case says what the track status
+was during the lap.
+
+Author: Rohith Ravindranath
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import fastf1
+try:
+    from fastf1.exceptions import DataNotLoadedError
+except ImportError:  # FastF1 < 3.7 only exposes it from fastf1.core
+    from fastf1.core import DataNotLoadedError
+from app.core.cache import shared_cache
+from app.core.config import settings
+from app.core.logger import logger
+from app.models.schemas import SessionLaps
+
+TRACK_TEMP_BIN_WIDTH = 5
+
+WEATHER_COLUMNS = ['AirTemp', 'TrackTemp', 'Humidity', 'Pressure', 'Rainfall',
+                   'WindSpeed', 'WindDirection']
+
+# Track status codes as published by the F1 live timing API
+STATUS_FLAGS = {
+    'UnderYellowFlag': ('2',),
+    'UnderSafetyCar': ('4',),
+    'UnderRedFlag': ('5',),
+    'UnderVirtualSafetyCar': ('6', '7'),
+}
+
+LAP_COLUMNS = ['Driver', 'DriverNumber', 'Team', 'LapNumber', 'Stint', 'Compound',
+               'TyreLife', 'LapTime', 'LapStartTime', 'Time', 'PitInTime', 'PitOutTime',
+               'IsPersonalBest', 'Deleted']
+
+
+def _seconds(values: pd.Series) -> np.ndarray:
+    """Convert a series of session timedeltas to float seconds, NaT becoming NaN."""
+    return pd.to_timedelta(values).dt.total_seconds().to_numpy(dtype=float)
+
+
+def align_laps(laps: pd.DataFrame, weather: pd.DataFrame,
+               track_status: pd.DataFrame) -> pd.DataFrame:
+    """Align laps with the weather and track status in effect on each lap.
+
+    Weather and the starting track status are attached with backward as-of joins on
+    the lap start time. Status flags are computed by treating each track status
+    sample as an interval lasting until the next sample and checking, for every lap
+    at once, whether any interval of that status overlaps the lap.
+
+    Args:
+        laps (pd.DataFrame): Laps with session-time ``LapStartTime`` and ``Time``
+            (lap end) columns, as provided by ``Session.laps``.
+        weather (pd.DataFrame): Weather samples with a session-time ``Time`` column.
+        track_status (pd.DataFrame): Track status changes with ``Time`` and ``Status``.
+    Returns:
+        pd.DataFrame: A copy of ``laps`` with the derived columns added.
+    """
+    aligned = pd.DataFrame(laps).copy()
+    start = _seconds(aligned['LapStartTime'])
+    end = _seconds(aligned['Time'])
+    # Fall back to the lap time when a lap has no recorded start
+    if 'LapTime' in aligned:
+        missing = np.isnan(start)
+        start[missing] = end[missing] - _seconds(aligned['LapTime'])[missing]
+    valid = ~np.isnan(start)
+
+    keys = pd.DataFrame({'_row': np.arange(len(aligned))[valid], '_start': start[valid]})
+    keys = keys.sort_values('_start')
+
+    weather = pd.DataFrame(weather)
+    weather_columns = [c for c in WEATHER_COLUMNS if c in weather]
+    if len(weather):
+        samples = weather[weather_columns].assign(_start=_seconds(weather['Time']))
+        samples = samples.dropna(subset=['_start']).sort_values('_start')
+        matched = pd.merge_asof(keys, samples, on='_start', direction='backward')
+        for column in weather_columns:
+            values = np.full(len(aligned), np.nan)
+            values[matched['_row'].to_numpy()] = matched[column].to_numpy(dtype=float)
+            aligned[column] = values
+    for column in WEATHER_COLUMNS:
+        if column not in aligned:
+            aligned[column] = np.nan
+    aligned['Rainfall'] = aligned['Rainfall'].astype('boolean')
+
+    bin_start = (np.floor(aligned['TrackTemp'] / TRACK_TEMP_BIN_WIDTH)
+                 * TRACK_TEMP_BIN_WIDTH).astype('Int64')
+    labels = bin_start.astype(str) + '-' + (bin_start + TRACK_TEMP_BIN_WIDTH).astype(str)
+    aligned['TrackTempBin'] = labels.astype(object).where(bin_start.notna(), None)
+
+    status = pd.DataFrame(track_status)
+    status_at_start = np.full(len(aligned), None, dtype=object)
+    flags = {name: np.zeros(len(aligned), dtype=bool) for name in STATUS_FLAGS}
+    # Flags are only meaningful for laps with a known time span and status data
+    known = valid & ~np.isnan(end)
+    if len(status):
+        status = status.assign(_start=_seconds(status['Time']))
+        status = status.dropna(subset=['_start']).sort_values('_start', kind='stable')
+        matched = pd.merge_asof(keys, status[['_start', 'Status']], on='_start',
+                                direction='backward')
+        status_at_start[matched['_row'].to_numpy()] = matched['Status'].to_numpy()
+
+        # Each status holds from its sample until the next one; the last holds forever
+        interval_start = status['_start'].to_numpy()
+        interval_end = np.append(interval_start[1:], np.inf)
+        lap_start = np.where(known, start, 0.0)
+        lap_end = np.where(known, end, 0.0)
+        for name, codes in STATUS_FLAGS.items():
+            mask = status['Status'].isin(codes).to_numpy()
+            starts, ends = interval_start[mask], interval_end[mask]
+            # Intervals are disjoint and sorted, so the count overlapping a lap is the
+            # number opening before the lap ends minus those closed before it starts
+            opened = np.searchsorted(starts, lap_end, side='left')
+            closed = np.searchsorted(ends, lap_start, side='right')
+            flags[name] = (opened - closed) > 0
+    else:
+        known = np.zeros(len(aligned), dtype=bool)
+
+    aligned['TrackStatusAtStart'] = status_at_start
+    flags['IsGreenLap'] = ~np.logical_or.reduce(list(flags.values()))
+    for name, values in flags.items():
+        aligned[name] = pd.arrays.BooleanArray(values, mask=~known)
+    return aligned
+
+
+def _load_aligned_laps(year: int, round_number: int, session: str) -> pd.DataFrame:
+    """Load a session from FastF1 and return its laps aligned with weather and track status.
+    Args:
+        year (int): The season year.
+        round_number (int): The round number within the season.
+        session (str): The session identifier, e.g. "FP1", "Q" or "R".
+    Returns:
+        pd.DataFrame: The aligned laps.
+    """
+    try:
+        event_session = fastf1.get_session(year, round_number, session)
+        # Race control messages are needed for FastF1 to mark deleted laps
+        event_session.load(laps=True, telemetry=False, weather=True, messages=True)
+        laps = event_session.laps
+    except Exception as e:
+        raise RuntimeError(
+            f"Error loading session {session} of round {round_number} in {year}: {e}"
+        ) from e
+
+    laps = pd.DataFrame(laps)[[c for c in LAP_COLUMNS if c in laps]]
+    weather = _optional_frame(event_session, 'weather_data')
+    track_status = _optional_frame(event_session, 'track_status')
+    return align_laps(laps, weather, track_status)
+
+
+def _optional_frame(event_session, name: str) -> pd.DataFrame:
+    """Return a session data frame, or an empty frame if FastF1 failed to load it."""
+    try:
+        return getattr(event_session, name)
+    except DataNotLoadedError:
+        logger.warning("No %s available for %s, aligning laps without it", name, event_session)
+        return pd.DataFrame()
+
+
+def get_session_laps(year: int, round_number: int, session: str,
+                     driver: Optional[str] = None, green_only: bool = False,
+                     track_temp_bin: Optional[str] = None) -> SessionLaps:
+    """Fetch the laps of a session with weather and track status columns.
+
+    The aligned laps are cached per session in the shared cache; the filters are
+    applied to the cached frame on every request.
+    Args:
+        year (int): The season year.
+        round_number (int): The round number within the season.
+        session (str): The session identifier, e.g. "FP1", "Q" or "R".
+        driver (Optional[str]): Only return laps of this driver abbreviation.
+        green_only (bool): Only return laps known to be driven entirely under green
+            flag; laps with unknown track status are excluded.
+        track_temp_bin (Optional[str]): Only return laps in this track temperature bin.
+    Returns:
+        SessionLaps: The filtered laps of the session.
+    """
+    session = session.upper()
+    laps = shared_cache.get_or_set(
+        f"laps:{year}:{round_number}:{session}",
+        lambda: _load_aligned_laps(year, round_number, session),
+        ttl=settings.laps_cache_ttl,
+    )
+
+    if driver is not None:
+        laps = laps[laps['Driver'] == driver.upper()]
+    if green_only:
+        laps = laps[laps['IsGreenLap'].fillna(False).astype(bool)]
+    if track_temp_bin is not None:
+        laps = laps[laps['TrackTempBin'] == track_temp_bin]
+
+    laps = laps.copy()
+    for column in laps.select_dtypes(include='timedelta').columns:
+        laps[column] = laps[column].dt.total_seconds()
+    laps = laps.astype(object).where(laps.notna(), None)
+    return SessionLaps(year=year, round_number=round_number, session=session,
+                       laps=laps.to_dict('records'))
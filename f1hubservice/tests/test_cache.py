@@ -0,0 +1,120 @@
+"""
+Unit tests for the cross-process shared cache.
+
+Each test uses its own SQLite file; separate SharedCache instances pointing at the
+same file stand in for separate uvicorn workers.
+"""
+import threading
+import time
+
+from app.core.cache import SharedCache
+
+
+def make_cache(tmp_path, **kwargs):
+    return SharedCache(path=str(tmp_path / "cache.sqlite3"), max_bytes=kwargs.pop("max_bytes", 1 << 20),
+                       **kwargs)
+
+
+def test_set_and_get_roundtrip(tmp_path):
+    """Test that a stored value is visible to another instance on the same file."""
+    make_cache(tmp_path).set("k", {"year": 2024, "rounds": [1, 2]})
+    hit, value = make_cache(tmp_path).get("k")
+    assert hit
+    assert value == {"year": 2024, "rounds": [1, 2]}
+
+
+def test_get_missing_key(tmp_path):
+    """Test that a missing key is reported as a miss."""
+    assert make_cache(tmp_path).get("missing") == (False, None)
+
+
+def test_entry_expires_after_ttl(tmp_path):
+    """Test that entries past their TTL are treated as misses."""
+    cache = make_cache(tmp_path)
+    cache.set("k", "v", ttl=1.0)
+    assert cache.get("k") == (True, "v")
+    time.sleep(1.1)
+    assert cache.get("k") == (False, None)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """Test that the oldest unused entries are evicted once over the size limit."""
+    cache = make_cache(tmp_path, max_bytes=2500, touch_interval=0.0)
+    cache.set("a", b"x" * 1000)
+    cache.set("b", b"x" * 1000)
+    cache.get("a")
+    cache.set("c", b"x" * 1000)
+    assert cache.get("a")[0]
+    assert not cache.get("b")[0]
+    assert cache.get("c")[0]
+
+
+def test_oversized_value_not_stored(tmp_path):
+    """Test that a value larger than the whole cache is skipped."""
+    cache = make_cache(tmp_path, max_bytes=100)
+    cache.set("big", b"x" * 1000)
+    assert not cache.get("big")[0]
+
+
+def test_get_or_set_fetches_once_across_workers(tmp_path):
+    """Test that concurrent misses on one key call the factory a single time."""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.2)
+        return "schedule"
+
+    results = []
+
+    def worker():
+        results.append(make_cache(tmp_path, poll_interval=0.01).get_or_set("k", factory))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["schedule"] * 8
+
+
+def test_get_or_set_releases_lock_on_error(tmp_path):
+    """Test that a failing factory does not leave the key locked."""
+    cache = make_cache(tmp_path, lock_timeout=5.0)
+
+    def failing():
+        raise RuntimeError("upstream down")
+
+    try:
+        cache.get_or_set("k", failing)
+    except RuntimeError:
+        pass
+    start = time.monotonic()
+    assert cache.get_or_set("k", lambda: "ok") == "ok"
+    assert time.monotonic() - start < 1.0
+
+
+def test_stale_lock_is_reclaimed(tmp_path):
+    """Test that a lock left by a crashed worker expires after the lock timeout."""
+    crashed = make_cache(tmp_path, lock_timeout=0.05)
+    assert crashed._acquire("k", "crashed-worker")
+    time.sleep(0.1)
+    # The waiter's own deadline is far away, so it only succeeds by reclaiming the lock
+    waiter = make_cache(tmp_path, lock_timeout=30.0, poll_interval=0.01)
+    start = time.monotonic()
+    assert waiter.get_or_set("k", lambda: "ok") == "ok"
+    assert time.monotonic() - start < 5.0
+
+
+def test_recent_hit_does_not_write(tmp_path):
+    """Test that a hit within the touch interval leaves the access time unchanged."""
+    cache = make_cache(tmp_path, touch_interval=60.0)
+    cache.set("k", "v")
+    conn = cache._connect()
+    before = conn.execute("SELECT accessed_at FROM entries WHERE key = 'k'").fetchone()[0]
+    assert cache.get("k") == (True, "v")
+    after = conn.execute("SELECT accessed_at FROM entries WHERE key = 'k'").fetchone()[0]
+    conn.close()
+    assert before == after
@@ -0,0 +1,156 @@
+"""
+Unit tests for aligning laps with weather and track status.
+
+These tests build small session frames by hand so that they do not depend on
+the FastF1 live timing API.
+"""
+import pandas as pd
+
+from app.core.cache import SharedCache
+from app.services import lap_processor
+from app.services.lap_processor import DataNotLoadedError, align_laps
+
+FLAG_COLUMNS = ["UnderYellowFlag", "UnderSafetyCar", "UnderVirtualSafetyCar",
+                "UnderRedFlag", "IsGreenLap"]
+
+
+def seconds(*values):
+    return pd.to_timedelta(list(values), unit="s")
+
+
+def make_laps():
+    return pd.DataFrame({
+        "Driver": ["VER", "VER", "VER", "VER"],
+        "DriverNumber": ["1", "1", "1", "1"],
+        "LapNumber": [1.0, 2.0, 3.0, 4.0],
+        "LapStartTime": seconds(100, 190, 280, 370),
+        "Time": seconds(190, 280, 370, 460),
+        "LapTime": seconds(90, 90, 90, 90),
+    })
+
+
+def make_weather():
+    return pd.DataFrame({
+        "Time": seconds(0, 200, 300),
+        "AirTemp": [20.0, 21.0, 22.0],
+        "TrackTemp": [34.9, 35.0, 41.2],
+        "Humidity": [50.0, 50.0, 50.0],
+        "Pressure": [1000.0, 1000.0, 1000.0],
+        "Rainfall": [False, False, True],
+        "WindSpeed": [1.0, 1.0, 1.0],
+        "WindDirection": [90, 90, 90],
+    })
+
+
+def make_track_status():
+    return pd.DataFrame({
+        "Time": seconds(0, 250, 300, 380, 400),
+        "Status": ["1", "4", "1", "6", "1"],
+        "Message": ["AllClear", "SCDeployed", "AllClear", "VSCDeployed", "AllClear"],
+    })
+
+
+def test_weather_taken_from_sample_in_effect_at_lap_start():
+    """Test that each lap gets the latest weather sample at or before its start."""
+    aligned = align_laps(make_laps(), make_weather(), make_track_status())
+    assert aligned["AirTemp"].tolist() == [20.0, 20.0, 21.0, 22.0]
+    assert aligned["Rainfall"].tolist() == [False, False, False, True]
+
+
+def test_track_temperature_bins():
+    """Test that track temperatures are grouped into fixed width bands."""
+    aligned = align_laps(make_laps(), make_weather(), make_track_status())
+    assert aligned["TrackTempBin"].tolist() == ["30-35", "30-35", "35-40", "40-45"]
+
+
+def test_safety_car_flags_cover_whole_lap():
+    """Test that a status change during a lap flags that lap, not only lap starts."""
+    aligned = align_laps(make_laps(), make_weather(), make_track_status())
+    assert aligned["TrackStatusAtStart"].tolist() == ["1", "1", "4", "1"]
+    assert aligned["UnderSafetyCar"].tolist() == [False, True, True, False]
+    assert aligned["UnderVirtualSafetyCar"].tolist() == [False, False, False, True]
+    assert aligned["IsGreenLap"].tolist() == [True, False, False, False]
+
+
+def test_missing_lap_start_uses_lap_time():
+    """Test that a lap without a start time is aligned from its end and lap time."""
+    laps = make_laps()
+    laps.loc[1, "LapStartTime"] = pd.NaT
+    aligned = align_laps(laps, make_weather(), make_track_status())
+    assert aligned.loc[1, "AirTemp"] == 20.0
+    assert aligned.loc[1, "UnderSafetyCar"]
+
+
+def test_no_weather_or_track_status():
+    """Test that sessions without weather or status data still return every lap."""
+    aligned = align_laps(make_laps(), pd.DataFrame(), pd.DataFrame())
+    assert len(aligned) == 4
+    assert aligned["TrackTemp"].isna().all()
+    assert aligned["TrackTempBin"].isna().all()
+    assert aligned[FLAG_COLUMNS].isna().all().all()
+
+
+def test_lap_without_start_or_lap_time_has_unknown_status():
+    """Test that a lap that cannot be placed in the session gets no status flags."""
+    laps = make_laps()
+    laps.loc[3, "LapStartTime"] = pd.NaT
+    laps.loc[3, "LapTime"] = pd.NaT
+    aligned = align_laps(laps, make_weather(), make_track_status())
+    assert aligned.loc[3, FLAG_COLUMNS].isna().all()
+    assert aligned.loc[:2, "UnderSafetyCar"].tolist() == [False, True, True]
+
+
+def test_green_only_excludes_laps_with_unknown_status(tmp_path, monkeypatch):
+    """Test that laps without track status are not returned as green laps."""
+    cache = SharedCache(path=str(tmp_path / "cache.sqlite3"), max_bytes=1 << 20)
+    cache.set("laps:2024:1:R", align_laps(make_laps(), make_weather(), pd.DataFrame()))
+    monkeypatch.setattr(lap_processor, "shared_cache", cache)
+
+    assert lap_processor.get_session_laps(2024, 1, "R", green_only=True).laps == []
+    laps = lap_processor.get_session_laps(2024, 1, "R").laps
+    assert len(laps) == 4
+    assert laps[0].IsGreenLap is None
+
+
+def test_get_session_laps_filters_cached_session(tmp_path, monkeypatch):
+    """Test that lap queries filter the aligned laps stored for the session."""
+    cache = SharedCache(path=str(tmp_path / "cache.sqlite3"), max_bytes=1 << 20)
+    cache.set("laps:2024:1:R", align_laps(make_laps(), make_weather(), make_track_status()))
+    monkeypatch.setattr(lap_processor, "shared_cache", cache)
+
+    result = lap_processor.get_session_laps(2024, 1, "r", driver="ver", green_only=True)
+    assert result.session == "R"
+    assert [lap.LapNumber for lap in result.laps] == [1.0]
+    assert result.laps[0].LapTime == 90.0
+    assert result.laps[0].TrackTempBin == "30-35"
+
+
+class SessionWithoutWeather:
+    """Stand-in for a FastF1 session whose weather data failed to load."""
+
+    def load(self, **kwargs):
+        self.load_kwargs = kwargs
+
+    @property
+    def laps(self):
+        return make_laps()
+
+    @property
+    def weather_data(self):
+        raise DataNotLoadedError("The data you are trying to access has not been loaded yet.")
+
+    @property
+    def track_status(self):
+        return make_track_status()
+
+
+def test_load_aligned_laps_without_weather(monkeypatch):
+    """Test that a session whose weather failed to load still returns aligned laps."""
+    stub = SessionWithoutWeather()
+    monkeypatch.setattr(lap_processor.fastf1, "get_session", lambda *args: stub)
+
+    aligned = lap_processor._load_aligned_laps(2024, 1, "R")
+    assert stub.load_kwargs["messages"]
+    assert len(aligned) == 4
+    assert aligned["AirTemp"].isna().all()
+    assert aligned["UnderSafetyCar"].tolist() == [False, True, True, False]